@@ -0,0 +1,33 @@
+"""
+This module is responsible for loading the application settings
+from the environment and the .env file.
+"""
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+__all__ = ("Settings", "settings")
+
+
+class Settings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        extra="ignore",
+    )
+
+    database_url: str
+    testing: bool = False
+    debug: bool = False
+    secret_key: str = ""
+
+    # Database connection pool
+    database_pool_size: int = 25
+    database_max_overflow: int = 25
+    database_pool_recycle: int = 1800
+
+    # Statement caches
+    database_query_cache_size: int = 1200
+    database_statement_cache_size: int = 1024
+    database_prepared_statement_cache_size: int = 512
+
+
+settings = Settings()
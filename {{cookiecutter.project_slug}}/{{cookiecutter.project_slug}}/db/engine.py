@@ -0,0 +1,35 @@
+"""
+This module creates the single database engine shared by the whole
+application, so every session reuses the same connection pool.
+"""
+
+from typing import Any
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from {{cookiecutter.project_slug}}.configuration.config import settings
+
+__all__ = ("engine",)
+
+
+connect_args: dict[str, Any] = {}
+if make_url(settings.database_url).get_driver_name() == "asyncpg":
+    # Keep prepared statements of the recurrent repository queries
+    # on each connection instead of re-preparing them.
+    connect_args = {
+        "statement_cache_size": settings.database_statement_cache_size,
+        "prepared_statement_cache_size": settings.database_prepared_statement_cache_size,
+    }
+
+
+engine: AsyncEngine = create_async_engine(
+    settings.database_url,
+    connect_args=connect_args,
+    query_cache_size=settings.database_query_cache_size,
+    pool_size=settings.database_pool_size,
+    max_overflow=settings.database_max_overflow,
+    pool_recycle=settings.database_pool_recycle,
+    pool_pre_ping=True,
+    pool_use_lifo=True,
+)
@@ -0,0 +1,25 @@
+from typing import AsyncGenerator
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from {{cookiecutter.project_slug}}.configuration.config import settings
+from .engine import engine
+
+__all__ = ("AsyncSessionLocal", "get_session")
+
+
+# expire_on_commit=False keeps the instances returned by the repositories
+# usable after commit instead of triggering lazy reloads.
+# raise_on_lazy_load makes the repositories fail on N+1 lazy loads in debug.
+AsyncSessionLocal = async_sessionmaker(
+    engine,
+    expire_on_commit=False,
+    info={"raise_on_lazy_load": settings.debug},
+)
+
+
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency that provides a session bound to the shared pool."""
+
+    async with AsyncSessionLocal() as session:
+        yield session
@@ -0,0 +1,31 @@
+from fastapi import FastAPI
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+
+from {{cookiecutter.project_slug}}.configuration.config import settings
+from {{cookiecutter.project_slug}}.utils.error_handlers import (
+    custom_base_errors_handler,
+    pydantic_validation_errors_handler,
+    python_base_error_handler,
+)
+from {{cookiecutter.project_slug}}.utils.errors import BaseError
+
+__all__ = ("app", "create_app")
+
+
+def create_app() -> FastAPI:
+    """The application factory."""
+
+    app = FastAPI(
+        debug=settings.debug,
+        default_response_class=ORJSONResponse,
+    )
+
+    app.add_exception_handler(BaseError, custom_base_errors_handler)
+    app.add_exception_handler(RequestValidationError, pydantic_validation_errors_handler)
+    app.add_exception_handler(Exception, python_base_error_handler)
+
+    return app
+
+
+app = create_app()
@@ -1 +1,42 @@
-# unit tests 
\ No newline at end of file
+# unit tests
+from typing import AsyncGenerator
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from {{cookiecutter.project_slug}}.db.base import Base
+
+
+@pytest.fixture
+async def session() -> AsyncGenerator[AsyncSession, None]:
+    """A session bound to a fresh in-memory database.
+    Lazy loads raise, so N+1 queries fail the tests."""
+
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(
+        engine,
+        expire_on_commit=False,
+        info={"raise_on_lazy_load": True},
+    )
+    async with session_factory() as session:
+        yield session
+
+    await engine.dispose()
+
+
+@pytest.fixture
+def statements(session) -> list[str]:
+    """The SQL statements executed by the session from this point on."""
+
+    executed: list[str] = []
+
+    def record(_connection, _cursor, statement, *_):
+        executed.append(statement)
+
+    event.listen(session.bind.sync_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(session.bind.sync_engine, "before_cursor_execute", record)
@@ -0,0 +1,47 @@
+"""
+This module includes the database models and repositories used by the tests.
+"""
+
+from sqlalchemy import Column, Date, ForeignKey, Integer, String
+from sqlalchemy.orm import relationship
+
+from {{cookiecutter.project_slug}}.db.base import Base
+from {{cookiecutter.project_slug}}.utils.repositories import BaseRepository
+
+__all__ = (
+    "Parent",
+    "Child",
+    "ParentRepository",
+    "ChildRepository",
+    "ChildWithParentRepository",
+)
+
+
+class Parent(Base):
+    __tablename__ = "test_parents"
+
+    name = Column(String, nullable=True)
+
+    children = relationship("Child", back_populates="parent")
+
+
+class Child(Base):
+    __tablename__ = "test_children"
+
+    name = Column(String, nullable=True)
+    born_on = Column(Date, nullable=True)
+    parent_id = Column(Integer, ForeignKey("test_parents.id"), nullable=True)
+
+    parent = relationship("Parent", back_populates="children")
+
+
+class ParentRepository(BaseRepository[Parent]):
+    schema_class = Parent
+
+
+class ChildRepository(BaseRepository[Child]):
+    schema_class = Child
+
+
+class ChildWithParentRepository(ChildRepository):
+    DEFAULT_RELATIONSHIPS = ("parent",)
@@ -0,0 +1,233 @@
+from datetime import date
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+from {{cookiecutter.project_slug}}.tests.models import (
+    ChildRepository,
+    ChildWithParentRepository,
+    ParentRepository,
+)
+from {{cookiecutter.project_slug}}.utils.errors import BadRequestError, NotFoundError, UnprocessableError
+
+
+@pytest.fixture
+async def family(session):
+    parents = ParentRepository(session)
+    children = ChildRepository(session)
+
+    parent = await parents._save({"name": "parent"})
+    await parents._save({"name": None})
+    await children._save({"name": "child", "parent_id": parent.id})
+    await children._save({"name": "orphan", "parent_id": None})
+
+    return parent
+
+
+async def test_find_by_none_value(session, family):
+    child = await ChildRepository(session).find_by({"parent_id": None})
+
+    assert child.name == "orphan"
+
+
+async def test_find_by_relationship_value(session, family):
+    child = await ChildRepository(session).find_by({"parent": family})
+
+    assert child.name == "child"
+
+
+async def test_exists_none_value(session, family):
+    assert await ParentRepository(session)._exists({"name": None})
+
+
+async def test_exists_relationship_value(session, family):
+    assert await ChildRepository(session)._exists({"parent": family})
+    assert not await ChildRepository(session)._exists({"name": "nobody"})
+
+
+async def test_save_with_relationship_value(session, family):
+    child = await ChildRepository(session)._save({"name": "adopted", "parent": family})
+
+    assert child.id is not None
+    assert child.parent_id == family.id
+    assert child.created_at is not None
+
+
+async def test_all_stops_early(session, family):
+    children = ChildRepository(session)
+
+    rows = children._all(chunk_size=1)
+    async for _ in rows:
+        break
+    await rows.aclose()
+
+    assert await children.count() == 2
+
+
+async def _walk_keyset(repository, sort_by, page_size=2):
+    seen, cursor = [], None
+    while True:
+        page = await repository._all_keyset(cursor, page_size, sort_by=sort_by)
+        seen += [schema.id for schema in page["result"]]
+        if not page["has_more"]:
+            return seen
+        cursor = page["next_cursor"]
+
+
+@pytest.mark.parametrize("sort_by", ["id", "name", "born_on", "created_at"])
+async def test_all_keyset_returns_every_row_once(session, sort_by):
+    children = ChildRepository(session)
+    for name, born_on in [
+        ("a", date(2020, 1, 1)),
+        (None, None),
+        ("b", date(2021, 1, 1)),
+        (None, date(2021, 1, 1)),
+        ("b", None),
+        ("c", date(2019, 1, 1)),
+    ]:
+        await children._save({"name": name, "born_on": born_on})
+
+    seen = await _walk_keyset(children, sort_by)
+
+    assert sorted(seen) == list(range(1, 7))
+    assert len(seen) == len(set(seen))
+
+
+async def test_all_keyset_orders_nulls_last(session):
+    children = ChildRepository(session)
+    for name in ["a", None, "b", None]:
+        await children._save({"name": name})
+
+    assert await _walk_keyset(children, "name", page_size=1) == [3, 1, 4, 2]
+
+
+async def test_all_keyset_invalid_cursor(session):
+    with pytest.raises(BadRequestError):
+        await ChildRepository(session)._all_keyset("not a cursor", 10)
+
+
+@pytest.mark.parametrize("sort_by", ["id", "created_at"])
+async def test_all_keyset_not_null_sort_has_no_null_handling(session, statements, sort_by):
+    children = ChildRepository(session)
+    for name in ["a", "b", "c"]:
+        await children._save({"name": name})
+
+    page = await children._all_keyset(None, 1, sort_by=sort_by)
+    statements.clear()
+    await children._all_keyset(page["next_cursor"], 1, sort_by=sort_by)
+
+    sql = statements[-1].upper()
+    assert "IS NULL" not in sql
+    assert "NULLS LAST" not in sql
+
+
+@pytest.mark.parametrize("page_size", [0, -1])
+async def test_all_keyset_invalid_page_size(session, family, page_size):
+    with pytest.raises(UnprocessableError):
+        await ChildRepository(session)._all_keyset(None, page_size)
+
+
+async def test_lazy_load_raises(session, family):
+    session.expunge_all()
+    child = await ChildRepository(session).find_by({"name": "child"})
+
+    with pytest.raises(InvalidRequestError):
+        child.parent
+
+
+async def test_default_relationships_are_loaded(session, family):
+    session.expunge_all()
+    child = await ChildWithParentRepository(session).find_by({"name": "child"})
+
+    assert child.parent.name == "parent"
+
+
+async def test_explicit_relationships_override_defaults(session, family):
+    session.expunge_all()
+    child = await ChildWithParentRepository(session).find_by({"name": "child"}, relationships=[])
+
+    with pytest.raises(InvalidRequestError):
+        child.parent
+
+
+async def test_all_paginated_page(session, family):
+    children = ChildRepository(session)
+    for index in range(3):
+        await children._save({"name": f"sibling {index}", "parent_id": family.id})
+
+    page = await children._all_paginated(2, 2, relationships=["parent"])
+
+    assert page["total_count"] == 5
+    assert len(page["result"]) == 2
+
+
+async def test_all_paginated_past_the_end(session, family):
+    children = ChildRepository(session)
+    for index in range(3):
+        await children._save({"name": f"sibling {index}", "parent_id": family.id})
+
+    page = await children._all_paginated(
+        5, 2, relationships=["parent"], filters={"parent__name": "parent"}
+    )
+
+    assert page["total_count"] == 4
+    assert page["result"] == []
+
+
+async def test_all_paginated_empty_table(session):
+    page = await ChildRepository(session)._all_paginated(1, 10)
+
+    assert page["total_count"] == 0
+    assert page["result"] == []
+
+
+async def test_get_identity_map_hit(session, family, statements):
+    children = ChildRepository(session)
+    child = await children._save({"name": "new", "parent_id": family.id})
+    statements.clear()
+
+    assert await children._get(child.id) is child
+    assert statements == []
+
+    assert await children._get(child.id, relationships=["parent"]) is child
+    assert child.parent is family
+    assert not any("test_parents" in statement for statement in statements)
+
+
+async def test_get_loads_relationships(session, family):
+    session.expunge_all()
+    child = await ChildRepository(session)._get(1, relationships=["parent"])
+
+    assert child.parent.name == "parent"
+
+
+async def test_get_unknown_id(session, family):
+    with pytest.raises(NotFoundError):
+        await ChildRepository(session)._get(999)
+
+
+async def test_delete_many_in_batches(session, statements):
+    children = ChildRepository(session)
+    for index in range(5):
+        await children._save({"name": f"child {index}"})
+    statements.clear()
+
+    await children._delete_many([1, 3, 5], batch_size=2)
+
+    assert sum(statement.startswith("DELETE") for statement in statements) == 2
+    assert sorted([child.id async for child in children._all()]) == [2, 4]
+
+
+async def test_delete_many_empty_ids(session, family, statements):
+    children = ChildRepository(session)
+    statements.clear()
+
+    await children._delete_many([])
+
+    assert statements == []
+    assert await children.count() == 2
+
+
+async def test_delete_many_invalid_batch_size(session, family):
+    with pytest.raises(UnprocessableError):
+        await ChildRepository(session)._delete_many([1], batch_size=0)
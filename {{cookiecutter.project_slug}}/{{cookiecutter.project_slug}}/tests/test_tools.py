@@ -0,0 +1,71 @@
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import Column, Date, DateTime, Integer, Numeric, String, Uuid, select
+
+from {{cookiecutter.project_slug}}.tests.models import Child
+from {{cookiecutter.project_slug}}.utils.errors import BadRequestError
+from {{cookiecutter.project_slug}}.utils.tools import (
+    _build_filter_template,
+    build_filters,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+def test_build_filters_joins_relationship_once():
+    query = build_filters(Child, select(Child), {"parent__name": "parent", "parent__id": 1})
+
+    assert str(query).count("JOIN") == 1
+
+
+def test_build_filters_caches_template():
+    filters = {"name": "child", "parent__name": "parent"}
+    build_filters(Child, select(Child), filters)
+    hits = _build_filter_template.cache_info().hits
+
+    build_filters(Child, select(Child), dict(reversed(filters.items())))
+
+    assert _build_filter_template.cache_info().hits == hits + 1
+
+
+@pytest.mark.parametrize(
+    "column, value",
+    [
+        (Column("id", Integer), 42),
+        (Column("name", String), "name"),
+        (Column("name", String), None),
+        (Column("created_at", DateTime), datetime(2024, 5, 1, 12, 30)),
+        (Column("born_on", Date), date(2024, 5, 1)),
+        (Column("price", Numeric), Decimal("10.50")),
+        (Column("uuid", Uuid), uuid.uuid4()),
+    ],
+)
+def test_cursor_round_trip(column, value):
+    cursor = encode_cursor(value, 7, column)
+
+    assert decode_cursor(cursor, column) == (value, 7)
+
+
+@pytest.mark.parametrize(
+    "column, cursor",
+    [
+        (Column("id", Integer), "not a cursor"),
+        (Column("id", Integer), encode_cursor(1, 1, Column("id", Integer))[:-4]),
+        (Column("id", Integer), encode_cursor(1, "not an id", Column("id", Integer))),
+        (Column("born_on", Date), encode_cursor("not a date", 1, Column("name", String))),
+        (Column("price", Numeric), encode_cursor("not a number", 1, Column("name", String))),
+        (Column("id", Integer), encode_cursor("x", 1, Column("name", String))),
+        (Column("id", Integer), encode_cursor([1], 1, Column("name", String))),
+        (Column("id", Integer), encode_cursor(True, 1, Column("name", String))),
+        (Column("id", Integer), encode_cursor(1, True, Column("id", Integer))),
+        (Column("name", String), encode_cursor(1, 1, Column("id", Integer))),
+        (Column("name", String), encode_cursor({"a": 1}, 1, Column("id", Integer))),
+        (Column("id", Integer, nullable=False), encode_cursor(None, 1, Column("id", Integer))),
+    ],
+)
+def test_decode_invalid_cursor(column, cursor):
+    with pytest.raises(BadRequestError):
+        decode_cursor(cursor, column)
@@ -1,17 +1,19 @@
+from itertools import islice
+
 from sqlalchemy.exc import IntegrityError, InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 
 from {{cookiecutter.project_slug}}.db.base import ConcreteTable
 from .errors import DatabaseError, NotFoundError, UnprocessableError
-from typing import Any, AsyncGenerator, Generic, Type, Optional, Dict, List
-from sqlalchemy import asc, delete, desc, func, select, update, or_
+from typing import Any, AsyncGenerator, Generic, Iterable, Type, Optional, Dict, List, Tuple
+from sqlalchemy import asc, delete, desc, func, inspect, literal, select, update, or_, tuple_
 from sqlalchemy.engine import Result
 from asyncpg.exceptions import UniqueViolationError
 
 __all__ = ("BaseRepository",)
 
-from .tools import build_filters
+from .tools import build_filters, decode_cursor, encode_cursor
 
 
 class BaseRepository(Generic[ConcreteTable]):
@@ -22,6 +24,9 @@ class BaseRepository(Generic[ConcreteTable]):
     """
 
     schema_class: Type[ConcreteTable]
+    # Relationships eagerly loaded when a method is called without
+    # an explicit relationships list.
+    DEFAULT_RELATIONSHIPS: Tuple[str, ...] = ()
     _ERRORS = (IntegrityError, InvalidRequestError, UniqueViolationError)
 
     def __init__(self, session: AsyncSession) -> None:
@@ -34,6 +39,48 @@ class BaseRepository(Generic[ConcreteTable]):
                 )
             )
 
+    @staticmethod
+    def _loader_for(schema_class: Type[ConcreteTable], name: str) -> Any:
+        """Pick the eager loader of a relationship: a JOIN for single-valued
+        (many-to-one, one-to-one) relationships and a separate IN select
+        for collections, which would multiply the parent rows if joined."""
+
+        attribute = getattr(schema_class, name)
+        if attribute.property.uselist:
+            return selectinload(attribute)
+        return joinedload(attribute)
+
+    def _loader_options(self, relationships: Optional[List[str]] = None) -> List[Any]:
+        """Build the eager loading options for the given relationships.
+
+        When the session is built with info["raise_on_lazy_load"] set, any
+        other relationship access that would emit SQL raises, so N+1 lazy
+        loads are caught during development.
+        """
+        if relationships is None:
+            relationships = self.DEFAULT_RELATIONSHIPS
+
+        options = [self._loader_for(self.schema_class, relationship) for relationship in relationships]
+        if self._session.info.get("raise_on_lazy_load", False):
+            options.append(raiseload("*", sql_only=True))
+
+        return options
+
+    @staticmethod
+    def _build_eq_conditions(
+        schema_class: Type[ConcreteTable], filters: Dict[str, Any], normalize: bool = False
+    ) -> List[Any]:
+        """Build `column == value` conditions for the given filters.
+        String values are stripped and lowercased when normalize is set."""
+
+        conditions = []
+        for key, value in filters.items():
+            column = getattr(schema_class, key)
+            if normalize and isinstance(value, str):
+                value = value.strip().lower()
+            conditions.append(column == value)
+        return conditions
+
     async def _update(
         self, key: str, value: Any, payload: dict[str, Any]
     ) -> ConcreteTable:
@@ -55,32 +102,29 @@ class BaseRepository(Generic[ConcreteTable]):
         return schema
 
     async def _get(self, id_: int, relationships: Optional[List[str]] = None) -> ConcreteTable:
-        query = select(self.schema_class).where(self.schema_class.id == id_)
-
-        if relationships:
-            for relationship in relationships:
-                query = query.options(selectinload(getattr(self.schema_class, relationship)))
+        if relationships is None:
+            relationships = self.DEFAULT_RELATIONSHIPS
 
-        result: Result = await self._session.execute(query)
+        # session.get returns an instance already in the identity map
+        # without emitting any SQL.
+        instance = await self._session.get(
+            self.schema_class, id_, options=self._loader_options(relationships)
+        )
 
-        if not (instance := result.scalars().one_or_none()):
+        if instance is None:
             raise NotFoundError
 
+        # Loader options are not applied on an identity map hit,
+        # so load the requested relationships that are still missing.
+        if unloaded := inspect(instance).unloaded.intersection(relationships):
+            await self._session.refresh(instance, attribute_names=list(unloaded))
+
         return instance
 
     async def count(self) -> int:
-        result: Result = await self._session.execute(func.count(self.schema_class.id))
-        value = result.scalar()
-
-        if not isinstance(value, int):
-            raise UnprocessableError(
-                message=(
-                    "For some reason count function returned not an integer."
-                    f"Value: {value}"
-                ),
-            )
-
-        return value
+        query = select(func.count()).select_from(self.schema_class)
+        result: Result = await self._session.execute(query)
+        return result.scalar_one()
 
     async def find_by(self, filters: Dict[str, Any], relationships: Optional[List[str]] = None) -> Optional[
          ConcreteTable]:
@@ -89,20 +133,15 @@ class BaseRepository(Generic[ConcreteTable]):
         Args:
             filters (Dict[str, Any]): A dictionary of attributes and their corresponding values to filter by.
             relationships (Optional[List[str]]): A list of relationship names to eagerly load.
+                Defaults to DEFAULT_RELATIONSHIPS.
 
         Returns:
             Optional[ConcreteTable]: The found instance or None if no instance is found.
         """
-        query = select(self.schema_class)
-
-        # Apply relationships if provided
-        if relationships:
-            for relationship in relationships:
-                query = query.options(selectinload(getattr(self.schema_class, relationship)))
+        query = select(self.schema_class).options(*self._loader_options(relationships))
 
         # Apply filters dynamically
-        conditions = [getattr(self.schema_class, key) == value for key, value in filters.items()]
-        query = query.where(*conditions)
+        query = query.where(*self._build_eq_conditions(self.schema_class, filters))
 
         result: Result = await self._session.execute(query)
         return result.scalar_one_or_none()
@@ -131,19 +170,27 @@ class BaseRepository(Generic[ConcreteTable]):
         try:
             schema = self.schema_class(**payload)
             self._session.add(schema)
+            # The primary key and the python-side defaults are populated
+            # by the flush, so no refresh round trip is needed.
             await self._session.flush()
-            await self._session.refresh(schema)
             return schema
         except self._ERRORS as e:
             print(e)
             raise DatabaseError
 
-    async def _all(self) -> AsyncGenerator[ConcreteTable, None]:
-        result: Result = await self._session.execute(select(self.schema_class))
-        schemas = result.scalars().all()
+    async def _all(self, chunk_size: int = 500) -> AsyncGenerator[ConcreteTable, None]:
+        """Stream every row of the table, fetching chunk_size rows at a time
+        from a server-side cursor instead of loading the whole table."""
 
-        for schema in schemas:
-            yield schema
+        query = select(self.schema_class).execution_options(yield_per=chunk_size)
+        result = await self._session.stream_scalars(query)
+
+        try:
+            async for schema in result:
+                yield schema
+        finally:
+            # Release the server-side cursor when the consumer stops early
+            await result.close()
 
     async def _all_paginated(
         self,
@@ -152,26 +199,32 @@ class BaseRepository(Generic[ConcreteTable]):
         relationships: Optional[List[str]] = None,
         filters: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        if relationships is None:
-            relationships = []
-
-        query = select(self.schema_class)
-
-        for relationship in relationships:
-            query = query.options(selectinload(getattr(self.schema_class, relationship)))
+        query = select(self.schema_class).options(*self._loader_options(relationships))
 
         if filters:
             query = build_filters(self.schema_class, query, filters)
 
-        total_count_query = query.with_only_columns(func.count()).order_by(None)
-        total_count_result: Result = await self._session.execute(total_count_query)
-        total_count = total_count_result.scalar()
-
+        # The total is computed by a window function over the same filtered
+        # query, so a page costs a single round trip.
         offset = (page - 1) * page_size
-        query = query.limit(page_size).offset(offset)
+        paginated_query = (
+            query.add_columns(func.count().over().label("total_count"))
+            .limit(page_size)
+            .offset(offset)
+        )
 
-        result: Result = await self._session.execute(query)
-        schemas = result.scalars().all()
+        result: Result = await self._session.execute(paginated_query)
+        rows = result.all()
+        schemas = [row[0] for row in rows]
+
+        if rows:
+            total_count = rows[0][1]
+        elif offset:
+            # A page past the end has no row to carry the total.
+            total_count_query = select(func.count()).select_from(query.order_by(None).subquery())
+            total_count = (await self._session.execute(total_count_query)).scalar_one()
+        else:
+            total_count = 0
 
         return {
             "total_count": total_count,
@@ -180,23 +233,106 @@ class BaseRepository(Generic[ConcreteTable]):
             "result": schemas
         }
 
+    async def _all_keyset(
+        self,
+        cursor: Optional[str],
+        page_size: int,
+        sort_by: str = "id",
+        relationships: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Paginate the table with a keyset cursor instead of OFFSET.
+
+        Rows are ordered by (sort_by, id) descending and the next page starts
+        right after the row encoded in the cursor, so deep pages cost an
+        index seek instead of scanning every preceding row. A composite
+        (sort_by DESC, id DESC) index should exist for non-id sort columns,
+        with NULLS LAST for nullable ones, whose NULL rows come last.
+        """
+        if page_size < 1:
+            raise UnprocessableError(message="Page size must be a positive integer")
+
+        try:
+            sort_column = getattr(self.schema_class, sort_by)
+        except AttributeError as e:
+            raise UnprocessableError(
+                message=f"Invalid sort attribute: {str(e)}"
+            )
+
+        id_column = self.schema_class.id
+        query = select(self.schema_class).options(*self._loader_options(relationships))
+
+        if filters:
+            query = build_filters(self.schema_class, query, filters)
+
+        last_sort, last_id = decode_cursor(cursor, sort_column) if cursor else (None, None)
+
+        if sort_by == "id":
+            if cursor:
+                query = query.where(id_column < last_id)
+            order_by = (id_column.desc(),)
+        elif sort_column.nullable:
+            if cursor and last_sort is None:
+                # Already inside the trailing NULL group
+                query = query.where(sort_column.is_(None), id_column < last_id)
+            elif cursor:
+                query = query.where(or_(
+                    tuple_(sort_column, id_column) < tuple_(last_sort, last_id),
+                    sort_column.is_(None),
+                ))
+            order_by = (sort_column.desc().nulls_last(), id_column.desc())
+        else:
+            if cursor:
+                query = query.where(tuple_(sort_column, id_column) < tuple_(last_sort, last_id))
+            order_by = (sort_column.desc(), id_column.desc())
+
+        query = query.order_by(*order_by).limit(page_size + 1)
+
+        result: Result = await self._session.execute(query)
+        schemas = list(result.scalars())
+
+        # The extra row only signals that another page exists
+        has_more = len(schemas) > page_size
+        del schemas[page_size:]
+        next_cursor = None
+        if has_more:
+            last = schemas[-1]
+            next_cursor = encode_cursor(getattr(last, sort_by), last.id, sort_column)
+
+        return {
+            "page_size": page_size,
+            "next_cursor": next_cursor,
+            "has_more": has_more,
+            "result": schemas
+        }
+
     async def _delete(self, id_: int) -> None:
         await self._session.execute(
             delete(self.schema_class).where(self.schema_class.id == id_)
         )
 
+    async def _delete_many(self, ids: Iterable[int], batch_size: int = 1000) -> None:
+        """Delete rows by id with one statement per batch_size ids,
+        keeping each statement under the driver's parameter limit."""
+
+        if batch_size < 1:
+            raise UnprocessableError(message="Batch size must be a positive integer")
+
+        ids = iter(ids)
+        while batch := list(islice(ids, batch_size)):
+            await self._session.execute(
+                delete(self.schema_class).where(self.schema_class.id.in_(batch))
+            )
+
     async def _exists(self, filters: dict[str, Any]) -> bool:
         """Check if a record exists by given filters using OR operator."""
 
         try:
-            conditions = [
-                getattr(self.schema_class, key) == (value.strip().lower() if isinstance(value, str) else value)
-                for key, value in filters.items()
-            ]
+            conditions = self._build_eq_conditions(self.schema_class, filters, normalize=True)
         except AttributeError as e:
             raise UnprocessableError(
                 message=f"Invalid attribute in filters: {str(e)}"
             )
-        query = select(self.schema_class).where(or_(*conditions))
+        query = select(literal(1)).select_from(self.schema_class).where(or_(*conditions)).limit(1)
         result: Result = await self._session.execute(query)
-        return result.scalars().first() is not None
+        return result.scalar() is not None
@@ -1,11 +1,13 @@
 from collections.abc import Mapping
-from typing import Any, Generic
+from typing import Any, Generic, Optional
 
-from pydantic import Field, conlist
+from pydantic import Field, TypeAdapter, conlist
 
 __all__ = (
+    "BaseResponse",
     "ResponseMulti",
     "ResponseMultiPaginated",
+    "ResponseMultiCursor",
     "Response",
     "_Response",
     "ErrorResponse",
@@ -14,14 +16,58 @@ __all__ = (
 
 from .entities import PublicEntity, _PublicEntity
 
+_ADAPTERS: dict[type, TypeAdapter] = {}
+_PARAMETRIZED_MODELS: dict[tuple[type, Any], type] = {}
 
-class ResponseMulti(PublicEntity, Generic[_PublicEntity]):
+
+class BaseResponse(PublicEntity):
+    """Base class for the response models with a cached serialization path."""
+
+    def __class_getitem__(cls, params: Any) -> Any:
+        """Return the same parametrized model for the same parameters,
+        so e.g. ResponseMulti[User] is synthesized only once."""
+
+        key = (cls, params)
+        try:
+            model = _PARAMETRIZED_MODELS.get(key)
+        except TypeError:
+            # Unhashable parameters can not be cached
+            return super().__class_getitem__(params)
+
+        if model is None:
+            model = _PARAMETRIZED_MODELS[key] = super().__class_getitem__(params)
+        return model
+
+    @classmethod
+    def adapter(cls) -> TypeAdapter:
+        """Return the TypeAdapter of the concrete response model,
+        built once per parametrized class."""
+
+        if (adapter := _ADAPTERS.get(cls)) is None:
+            adapter = _ADAPTERS[cls] = TypeAdapter(cls)
+        return adapter
+
+    @classmethod
+    def serialize(cls, payload: Mapping[str, Any]) -> dict[str, Any]:
+        """Validate the payload (e.g. a repository pagination dict with ORM
+        rows) and dump it to JSON-compatible primitives by alias.
+        Routes can return the result directly instead of letting FastAPI
+        validate the response_model row by row.
+        """
+
+        adapter = cls.adapter()
+        return adapter.dump_python(
+            adapter.validate_python(payload), mode="json", by_alias=True
+        )
+
+
+class ResponseMulti(BaseResponse, Generic[_PublicEntity]):
     """Generic response model that consist multiple results."""
 
     result: list[_PublicEntity]
 
 
-class ResponseMultiPaginated(PublicEntity, Generic[_PublicEntity]):
+class ResponseMultiPaginated(BaseResponse, Generic[_PublicEntity]):
     """Generic response model that consist multiple results."""
     total_count: int
     page: int
@@ -29,7 +75,16 @@ class ResponseMultiPaginated(PublicEntity, Generic[_PublicEntity]):
     result: list[_PublicEntity]
 
 
-class Response(PublicEntity, Generic[_PublicEntity]):
+class ResponseMultiCursor(BaseResponse, Generic[_PublicEntity]):
+    """Generic response model that consist multiple results
+    paginated with a keyset cursor."""
+    page_size: int
+    next_cursor: Optional[str] = None
+    has_more: bool
+    result: list[_PublicEntity]
+
+
+class Response(BaseResponse, Generic[_PublicEntity]):
     """Generic response model that consist only one result."""
 
     result: _PublicEntity
@@ -1,13 +1,102 @@
-from typing import Dict, Any
+import base64
+import functools
+import json
+import uuid
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Callable, Dict, Any, Optional, Tuple
 
+from .errors import BadRequestError
 
-def build_filters(schema_class, query, filters: Dict[str, Any]) -> Any:
-    for attr, value in filters.items():
+
+@functools.lru_cache(maxsize=512)
+def _build_filter_template(schema_class, keys: Tuple[str, ...]) -> Tuple[Tuple[Any, Any], ...]:
+    """Resolve the filter keys of a schema class once per filter shape.
+
+    Returns (relationship or None, attribute) descriptors, so the `__` split
+    and mapper lookups are not repeated on every request.
+    """
+    template = []
+    for attr in keys:
         if '__' in attr:
             relationship, field = attr.split('__', 1)
-            related_class = getattr(schema_class, relationship).property.mapper.class_
-            query = query.join(getattr(schema_class, relationship))
-            query = query.filter(getattr(related_class, field) == value)
+            relationship_attr = getattr(schema_class, relationship)
+            related_class = relationship_attr.property.mapper.class_
+            template.append((relationship_attr, getattr(related_class, field)))
         else:
-            query = query.filter(getattr(schema_class, attr) == value)
-    return query
+            template.append((None, getattr(schema_class, attr)))
+    return tuple(template)
+
+
+def build_filters(schema_class, query, filters: Dict[str, Any]) -> Any:
+    keys = tuple(sorted(filters))
+    joined = set()
+    conditions = []
+    for attr, (relationship_attr, column) in zip(keys, _build_filter_template(schema_class, keys)):
+        if relationship_attr is not None and relationship_attr not in joined:
+            query = query.join(relationship_attr)
+            joined.add(relationship_attr)
+        conditions.append(column == filters[attr])
+    return query.filter(*conditions)
+
+
+_CURSOR_PARSERS: Dict[type, Callable[[str], Any]] = {
+    datetime: datetime.fromisoformat,
+    date: date.fromisoformat,
+    time: time.fromisoformat,
+    Decimal: Decimal,
+    uuid.UUID: uuid.UUID,
+}
+
+
+def _python_type(sort_column) -> Optional[type]:
+    try:
+        return sort_column.type.python_type
+    except NotImplementedError:
+        return None
+
+
+def encode_cursor(sort_value: Any, id_: int, sort_column) -> str:
+    """Encode the position of the last returned row into an opaque
+    url-safe keyset pagination cursor."""
+
+    if sort_value is not None and _python_type(sort_column) in _CURSOR_PARSERS:
+        sort_value = sort_value.isoformat() if hasattr(sort_value, "isoformat") else str(sort_value)
+    raw = json.dumps([sort_value, id_]).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str, sort_column) -> Tuple[Any, int]:
+    """Decode a cursor produced by encode_cursor back into
+    the (sort_value, id) pair of the last returned row."""
+
+    try:
+        sort_value, id_ = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not _is_instance(id_, int):
+            raise TypeError(id_)
+
+        if sort_value is None:
+            if not sort_column.nullable:
+                raise TypeError(sort_value)
+            return sort_value, id_
+
+        python_type = _python_type(sort_column)
+        parser = _CURSOR_PARSERS.get(python_type)
+        if parser is not None:
+            sort_value = parser(sort_value)
+        if python_type is not None and not _is_instance(sort_value, python_type):
+            raise TypeError(sort_value)
+    except (ValueError, TypeError, ArithmeticError):
+        raise BadRequestError(message="Invalid pagination cursor")
+    return sort_value, id_
+
+
+def _is_instance(value: Any, python_type: type) -> bool:
+    """isinstance that keeps bool apart from int and accepts
+    JSON integers for float columns."""
+
+    if isinstance(value, bool) and python_type is not bool:
+        return False
+    if python_type is float:
+        return isinstance(value, (int, float))
+    return isinstance(value, python_type)